@@ -1,10 +1,82 @@
 # -*- encoding: utf-8 -*-
+import csv
+import io
 from contextlib import contextmanager
+from typing import Callable, Literal
 
 import pandas as pd
-from sqlalchemy import Engine, text, Delete, Select
+from sqlalchemy import (
+    Delete,
+    Engine,
+    Select,
+    delete,
+    literal_column,
+    select,
+    text,
+    tuple_,
+)
 from tqdm import tqdm
 
+# Progress bar layout shared by every write_dataframe_to_db bar.
+_BAR_FORMAT: str = (
+    "{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]"
+)
+
+
+def _psql_copy_insert(table, conn, keys, data_iter) -> None:
+    """
+    Insertion method for pandas to_sql that loads rows with PostgreSQL COPY.
+    see: https://pandas.pydata.org/docs/user_guide/io.html#io-sql-method
+    :param table: pandas SQLTable being written.
+    :param conn: SQLAlchemy connection.
+    :param keys: Column names.
+    :param data_iter: Iterable of rows to insert.
+    """
+    dbapi_conn = conn.connection
+    with dbapi_conn.cursor() as cursor:
+        buffer = io.StringIO()
+        # Quote every non-None field so COPY keeps empty strings apart from
+        # NULLs, which stay as unquoted empty fields.
+        csv.writer(buffer, quoting=csv.QUOTE_NOTNULL).writerows(data_iter)
+        buffer.seek(0)
+
+        # Quote like SQLAlchemy did on CREATE TABLE, so mixed-case or reserved
+        # names resolve to the same relation.
+        preparer = conn.dialect.identifier_preparer
+        columns = ", ".join(preparer.quote(key) for key in keys)
+        table_name = preparer.format_table(table.table)
+        cursor.copy_expert(
+            f"COPY {table_name} ({columns}) FROM STDIN WITH CSV", buffer
+        )
+
+
+def _insert_with_progress(
+    method: Literal["multi"] | Callable | None, progress_bar: tqdm
+) -> Callable:
+    """
+    Wrap a pandas to_sql insertion method so each inserted chunk
+    advances a progress bar.
+    see: https://pandas.pydata.org/docs/user_guide/io.html#io-sql-method
+    :param method: to_sql method: None, "multi" or a callable.
+    :param progress_bar: Progress bar to update.
+    :return: Insertion method for pandas to_sql.
+    """
+
+    def insert(table, conn, keys, data_iter) -> int | None:
+        rows = list(data_iter)
+        if callable(method):
+            result = method(table, conn, keys, rows)
+        else:
+            data = [dict(zip(keys, row)) for row in rows]
+            if method == "multi":
+                result = conn.execute(table.table.insert().values(data)).rowcount
+            else:
+                result = conn.execute(table.table.insert(), data).rowcount
+        progress_bar.update(len(rows))
+        return result
+
+    return insert
+
 
 class DatabaseHandler:
     """
@@ -31,6 +103,8 @@ class DatabaseHandler:
     - The `empty_table()` method truncates a table in the database.
     - The `delete_records()` method deletes records from a table in the
       database using a delete statement.
+    - The `delete_records_chunked()` method deletes records from a table in
+      batches, committing after each batch.
     - The `write_dataframe_to_db()` method writes one or more Pandas DataFrames
       to a table in the database.
 
@@ -70,12 +144,36 @@ class DatabaseHandler:
         finally:
             session.close()
 
-    def execute_query(self, statement: Select) -> pd.DataFrame:
+    def execute_query(
+        self, statement: Select, use_arrow: bool = False
+    ) -> pd.DataFrame:
         """
         Execute SQL query.
         :param statement: SQL query.
+        :param use_arrow: Fetch the result with connectorx, which decodes the
+         server's wire format straight into Arrow columns. Faster for wide or
+         large results. Requires the optional `connectorx` package.
+         Default is False.
         :return: List of rows.
         """
+        if use_arrow:
+            import connectorx as cx
+
+            url = self.db_engine.url
+            url = url.set(drivername=url.get_backend_name())
+            # A percent paramstyle would double every literal "%"; connectorx
+            # does no interpolation to undo that.
+            dialect = type(self.db_engine.dialect)(paramstyle="named")
+            query = statement.compile(
+                dialect=dialect,
+                compile_kwargs={"literal_binds": True},
+            )
+            return cx.read_sql(
+                url.render_as_string(hide_password=False),
+                str(query),
+                return_type="pandas",
+            )
+
         with self._manage_session() as session:
             result_proxy = session.execute(statement)
             column_names = result_proxy.keys()
@@ -103,6 +201,57 @@ class DatabaseHandler:
             session.execute(delete_statement)
             session.commit()
 
+    def delete_records_chunked(
+        self, delete_statement: Delete, chunk_size: int = 50_000
+    ) -> int:
+        """
+        Delete records from a table in batches, committing after each batch,
+        so large deletes do not hold a single huge transaction.
+        :param delete_statement: Sqlalchemy delete statement.
+        :param chunk_size: Number of records deleted per batch.
+        :return: Total number of deleted records.
+        """
+        target = delete_statement.table
+        where_clause = delete_statement.whereclause
+        dialect_name: str = self.db_engine.dialect.name
+        if dialect_name == "postgresql":
+            # A ctid is only unique inside one physical table, so partitions
+            # and inherited tables need the tableoid as well.
+            row_id = (literal_column("tableoid"), literal_column("ctid"))
+        elif dialect_name == "sqlite":
+            row_id = (literal_column("rowid"),)
+        elif dialect_name in ("mysql", "mariadb"):
+            row_id = ()
+        else:
+            raise ValueError(
+                f"Chunked deletes are not supported for {dialect_name}."
+            )
+
+        if row_id:
+            batch = select(*row_id).select_from(target).correlate(None)
+            if where_clause is not None:
+                batch = batch.where(where_clause)
+            key = tuple_(*row_id) if len(row_id) > 1 else row_id[0]
+            statement = delete(target).where(key.in_(batch.limit(chunk_size)))
+        else:
+            statement = delete_statement.with_dialect_options(
+                mysql_limit=chunk_size
+            )
+
+        deleted: int = 0
+        with self._manage_session() as session, tqdm(
+            desc=f"Deleting records from {target.name}", unit="rows", colour="blue"
+        ) as progress_bar:
+            while True:
+                rowcount = session.execute(statement).rowcount
+                session.commit()
+                deleted += rowcount
+                progress_bar.update(rowcount)
+                # A short batch means nothing is left to match.
+                if rowcount < chunk_size:
+                    break
+        return deleted
+
     def write_dataframe_to_db(
         self, table_name: str, *dataframes: pd.DataFrame, **kwargs
     ) -> None:
@@ -111,28 +260,44 @@ class DatabaseHandler:
         :param table_name: Table name to operate on.
         :param dataframes: Dataframes to write to the database.
         :param kwargs: Additional arguments. Passed to pandas to_sql method.
+         `method="copy"` loads rows with PostgreSQL COPY (psycopg2 only). COPY
+         sends each value as its text form, skipping driver adaptation and
+         `dtype` bind processors, so use it only for plain numeric, boolean,
+         string and datetime columns. `if_exists` applies to the first
+         dataframe only; the rest are appended, all in a single transaction.
         """
         table = table_name.lower()
+        method = kwargs.pop("method", None)
+        if method == "copy":
+            dialect = self.db_engine.dialect
+            if dialect.name != "postgresql" or dialect.driver != "psycopg2":
+                raise ValueError(
+                    "method='copy' requires PostgreSQL with psycopg2, "
+                    f"got {dialect.name}+{dialect.driver}."
+                )
+            method = _psql_copy_insert
+        # Only the first dataframe may create or replace the table.
+        if_exists = kwargs.pop("if_exists", "fail")
 
-        with self._manage_session() as session:
+        with self._manage_session() as session, session.begin():
             for df in dataframes:
                 rows: int = df.shape[0]
-                # Load data in chunks
+                # pandas loads the data in chunks of kwargs["chunksize"] rows
                 with tqdm(
                     total=rows,
                     desc=f"Writing {rows:,.0f} rows to {table}",
                     unit="rows",
-                    bar_format="{desc}: {percentage:3.0f}%|{bar}| "
-                    "{n_fmt}/{total_fmt} [{elapsed}<{remaining}]",
+                    bar_format=_BAR_FORMAT,
                     colour="blue",
+                    mininterval=0.5,
+                    smoothing=0,
                 ) as progress_bar:
-                    for chunk_start in range(0, rows, kwargs["chunksize"]):
-                        chunk_end = min(chunk_start + kwargs["chunksize"], rows)
-                        data_chunk = df.iloc[chunk_start:chunk_end]
-                        data_chunk.to_sql(
-                            name=table,
-                            con=session,
-                            schema=self.schema,
-                            **kwargs,
-                        )
-                        progress_bar.update(data_chunk.shape[0])
+                    df.to_sql(
+                        name=table,
+                        con=session,
+                        schema=self.schema,
+                        if_exists=if_exists,
+                        method=_insert_with_progress(method, progress_bar),
+                        **kwargs,
+                    )
+                if_exists = "append"
@@ -1,9 +1,153 @@
+import hashlib
 import io
+import json
+import math
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Mapping, Optional
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaIoBaseDownload, MediaFileUpload
+from google.auth.transport.requests import AuthorizedSession
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.errors import HttpError
+from googleapiclient.http import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_HTTP_TIMEOUT_SEC,
+    MediaFileUpload,
+    MediaIoBaseDownload,
+    build_http,
+)
+
+# Windows opens descriptors in text mode unless asked otherwise.
+_O_BINARY: int = getattr(os, "O_BINARY", 0)
+
+_DRIVE_MEDIA_URL: str = (
+    "https://www.googleapis.com/drive/v3/files/{file_id}"
+    "?alt=media&supportsAllDrives=true"
+)
+
+
+@lru_cache(maxsize=None)
+def _get_discovery_document(api_name: str, version: str) -> Optional[str]:
+    """Load the discovery document of a Google API once per process.
+    :param api_name: The name of the API, e.g. "drive".
+    :param version: The version of the API, e.g. "v3".
+    :return: The document as JSON text, or None when googleapiclient does not
+     ship it.
+    """
+    # Kept as text: build_from_document adds to the parsed document in place.
+    return get_static_doc(api_name, version)
+
+
+def _build_service(api_name: str, version: str, credentials) -> Any:
+    """Build a Google API resource with its own HTTP connection.
+    httplib2 is not thread-safe, so resources are never shared; only the
+    discovery document is reused.
+    :param api_name: The name of the API, e.g. "drive".
+    :param version: The version of the API, e.g. "v3".
+    :param credentials: A Google OAuth2 credentials object.
+    :return: A Resource object to interact with the API.
+    """
+    http = AuthorizedHttp(credentials, http=build_http())
+    document = _get_discovery_document(api_name, version)
+    if document is None:
+        return build(api_name, version, http=http, cache_discovery=False)
+    return build_from_document(document, http=http)
+
+
+class _FdWriter:
+    """Write-only file backed by a raw file descriptor.
+    MediaIoBaseDownload only calls `write`, so chunks go straight to
+    os.write without the io buffering layers. Given an offset, the existing
+    file is kept and writing starts at that offset."""
+
+    def __init__(self, file_path: Path, offset: Optional[int] = None) -> None:
+        if offset is None:
+            # 0o666 filtered by the umask, like io.FileIO.
+            self._fd: int = os.open(
+                file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o666
+            )
+        else:
+            self._fd = os.open(file_path, os.O_WRONLY | _O_BINARY)
+            os.lseek(self._fd, offset, os.SEEK_SET)
+
+    def write(self, data: bytes) -> int:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._fd, view) :]
+        return len(data)
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class _SheetCache:
+    """On-disk LRU cache of Google Sheets values.
+    Each (spreadsheet id, range) has one entry holding the spreadsheet's
+    modifiedTime next to the values, so an edit makes the entry stale and the
+    next read overwrites it. Reads refresh an entry's mtime, and `evict`
+    removes the least recently used entries beyond max_entries. The cache is
+    best effort: disk errors (read-only directory, full disk) are ignored."""
+
+    def __init__(self, cache_dir: Path, max_entries: int = 1024) -> None:
+        self._cache_dir: Path = cache_dir
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            pass
+        self._max_entries: int = max_entries
+
+    def _entry_path(self, file_id: str, sheet_range: str) -> Path:
+        key = json.dumps([file_id, sheet_range]).encode()
+        return self._cache_dir.joinpath(f"{hashlib.sha256(key).hexdigest()}.json")
+
+    def get(self, file_id: str, sheet_range: str, revision: str) -> Optional[list]:
+        entry_path = self._entry_path(file_id, sheet_range)
+        try:
+            entry = json.loads(entry_path.read_bytes())
+            if entry["revision"] != revision:
+                return None
+            os.utime(entry_path)
+            return entry["values"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def set(self, file_id: str, sheet_range: str, revision: str, values: list) -> None:
+        entry_path = self._entry_path(file_id, sheet_range)
+        tmp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(json.dumps({"revision": revision, "values": values}))
+            os.replace(tmp_path, entry_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+    def evict(self) -> None:
+        """Removes the least recently used entries beyond max_entries."""
+        entries: List[Tuple[int, str]] = []
+        try:
+            with os.scandir(self._cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".json"):
+                        try:
+                            entries.append((entry.stat().st_mtime_ns, entry.path))
+                        except FileNotFoundError:
+                            pass
+        except OSError:
+            return
+        if len(entries) <= self._max_entries:
+            return
+        entries.sort()
+        for _, path in entries[: len(entries) - self._max_entries]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
 
 
 class GoogleDriveClient:
@@ -32,17 +176,42 @@ class GoogleDriveClient:
     - The `download_file_without_conversion` method is used to download a file
       from Google Drive without
     a conversion.
+    - The `download_file_parallel` method is used to download a large file
+      as concurrent byte ranges.
+    - The `download_files_bulk` method is used to download several files
+      concurrently.
     - The `retrieve_sheet_data` method is used to read a Google Sheet and
       return the data.
+    - The `retrieve_sheet_data_batch` method is used to read several ranges
+      of a Google Sheet in a single request. When a `sheet_cache_dir` is
+      given, ranges are served from disk until the spreadsheet changes; this
+      needs a Drive scope (e.g. drive.metadata.readonly) to read the
+      spreadsheet's modifiedTime, and reads are left uncached without it.
     """
 
-    def __init__(self, drive_config_manager):
+    def __init__(
+        self,
+        drive_config_manager,
+        chunksize: int = DEFAULT_CHUNK_SIZE,
+        sheet_cache_dir: Optional[Path] = None,
+    ):
         """Initializes the GdriveService
         :param drive_config_manager: A ConfigManager object.
+        :param chunksize: Bytes requested per download round trip. Default is
+         googleapiclient's DEFAULT_CHUNK_SIZE (100 MiB).
+        :param sheet_cache_dir: Directory where Google Sheets reads are cached
+         until the spreadsheet is modified, e.g. ~/.cache/gdrive_client.
+         The cache reads modifiedTime from Drive, so credentials with only a
+         Sheets scope are served uncached. Default is None, which disables
+         caching.
         """
+        self._chunksize = chunksize
+        self._sheet_cache: Optional[_SheetCache] = (
+            _SheetCache(sheet_cache_dir) if sheet_cache_dir is not None else None
+        )
         self._credentials = drive_config_manager.get_credentials()
-        self._service = build("drive", "v3", credentials=self._credentials)
-        self._sheet_service = build("sheets", "v4", credentials=self._credentials)
+        self._service = _build_service("drive", "v3", self._credentials)
+        self._sheet_service = _build_service("sheets", "v4", self._credentials)
 
     @property
     def creds(self):
@@ -53,24 +222,27 @@ class GoogleDriveClient:
         return self._service
 
     @staticmethod
-    def _create_file_writer(download_path: Path) -> io.FileIO:
+    def _create_file_writer(download_path: Path) -> _FdWriter:
         """Make a file writer
         :param download_path: The directory to download the file to.
 
         :return: A file object to write to the downloaded file.
         """
-        return io.FileIO(download_path, mode="wb")
+        return _FdWriter(download_path)
 
     @staticmethod
     def _send_download_request(
-        file_writer: io.FileIO | io.BytesIO, export_request: dict
+        file_writer: _FdWriter | io.BytesIO,
+        export_request: dict,
+        chunksize: int = DEFAULT_CHUNK_SIZE,
     ) -> MediaIoBaseDownload:
         """Make a download request
         :param file_writer: A file object to write to the downloaded file.
         :param export_request: A dictionary containing the file.
+        :param chunksize: Bytes requested per round trip.
         :return: A MediaIoBaseDownload object.
         """
-        return MediaIoBaseDownload(file_writer, export_request)
+        return MediaIoBaseDownload(file_writer, export_request, chunksize=chunksize)
 
     @staticmethod
     def _prepare_file_metadata(
@@ -94,15 +266,18 @@ class GoogleDriveClient:
     @staticmethod
     def track_download_progress(
         downloader_instance: MediaIoBaseDownload,
+        num_retries: int = 2,
     ) -> MediaIoBaseDownload:
         """Check file download status
         :param downloader_instance: A MediaIoBaseDownload object.
+        :param num_retries: Number of times to retry a failed chunk
+         request before giving up. Default is 2.
         :return: The status of the download.
         """
         done: bool = False
         status = None
         while not done:
-            status, done = downloader_instance.next_chunk()
+            status, done = downloader_instance.next_chunk(num_retries=num_retries)
         return status
 
     def _send_upload_request(
@@ -139,20 +314,144 @@ class GoogleDriveClient:
         """
         try:
             file_path: Path = directory_path.joinpath(file_name)
-            if mime_type:
-                export_request = self.service.files().export_media(
-                    fileId=file_id, mimeType=mime_type
-                )
-            else:
-                export_request = self.service.files().get_media(fileId=file_id)
-            file_writer = GoogleDriveClient._create_file_writer(file_path)
-            download_request_response = GoogleDriveClient._send_download_request(
-                file_writer, export_request
+            self._download_with_service(
+                self.service, file_path, file_id=file_id, mime_type=mime_type
             )
-            self.track_download_progress(download_request_response)
         except Exception as e:
             raise e
 
+    def _download_with_service(
+        self,
+        service,
+        file_path: Path,
+        *,
+        file_id: str,
+        mime_type: Optional[str] = None,
+    ) -> None:
+        """Download a file from Google Drive using the given Drive service
+        :param service: A Google Drive service object.
+        :param file_path: The path to download the file to.
+        :param file_id: The id of the file to download.
+        :param mime_type: The mime type to export the file to. Default is None.
+        """
+        if mime_type:
+            export_request = service.files().export_media(
+                fileId=file_id, mimeType=mime_type
+            )
+        else:
+            export_request = service.files().get_media(fileId=file_id)
+        file_writer = GoogleDriveClient._create_file_writer(file_path)
+        try:
+            download_request_response = GoogleDriveClient._send_download_request(
+                file_writer, export_request, chunksize=self._chunksize
+            )
+            self.track_download_progress(download_request_response)
+        finally:
+            file_writer.close()
+
+    def download_file_parallel(
+        self, file_id: str, file_path: Path, n_streams: int = 4
+    ) -> None:
+        """Download a large file from Google Drive as several byte ranges
+        fetched concurrently, each over its own connection, and written at
+        its offset of the destination file.
+        Only files with binary content are supported; export Google Workspace
+        files with `download_file` and a mime type.
+        :param file_id: The id of the file to download.
+        :param file_path: The path to download the file to.
+        :param n_streams: The number of concurrent range requests. Default is 4.
+        """
+        if n_streams < 1:
+            raise ValueError(f"n_streams must be at least 1, got {n_streams}.")
+        metadata = (
+            self.service.files()
+            .get(fileId=file_id, fields="size", supportsAllDrives=True)
+            .execute()
+        )
+        if "size" not in metadata:
+            raise ValueError(
+                f"File {file_id} has no binary content; use download_file "
+                "with a mime_type to export it."
+            )
+        file_size = int(metadata["size"])
+        url = _DRIVE_MEDIA_URL.format(file_id=file_id)
+        part_size = max(math.ceil(file_size / n_streams), 1)
+
+        def download_range(start: int) -> None:
+            end = min(start + part_size, file_size) - 1
+            with AuthorizedSession(self._credentials) as session:
+                response = session.get(
+                    url,
+                    headers={"Range": f"bytes={start}-{end}"},
+                    stream=True,
+                    timeout=DEFAULT_HTTP_TIMEOUT_SEC,
+                )
+                response.raise_for_status()
+                if response.status_code != 206 and part_size < file_size:
+                    raise RuntimeError(f"Range requests not honored for {file_id}.")
+                # Each range writes through its own descriptor and offset.
+                file_writer = _FdWriter(file_path, offset=start)
+                try:
+                    received = 0
+                    for chunk in response.iter_content(chunk_size=1 << 20):
+                        received += file_writer.write(chunk)
+                finally:
+                    file_writer.close()
+            if received != end - start + 1:
+                raise RuntimeError(
+                    f"Range {start}-{end} of {file_id} ended after "
+                    f"{received} bytes."
+                )
+
+        with open(file_path, "wb") as file:
+            file.truncate(file_size)
+        try:
+            with ThreadPoolExecutor(max_workers=n_streams) as executor:
+                futures = [
+                    executor.submit(download_range, start)
+                    for start in range(0, file_size, part_size)
+                ]
+                try:
+                    for future in futures:
+                        future.result()
+                except BaseException:
+                    # Drop the ranges not started yet; running ones finish.
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+        except BaseException:
+            # The file was preallocated to its full size, so a partial
+            # download would look complete.
+            file_path.unlink(missing_ok=True)
+            raise
+
+    def download_files_bulk(
+        self,
+        items: List[Tuple[str, Path, Optional[str]]],
+        max_workers: int = 8,
+    ) -> None:
+        """Download several files from Google Drive concurrently
+        :param items: (file_id, file_path, mime_type) tuples, where file_path
+         is the full destination path and mime_type is the export format or
+         None to download the file as is.
+        :param max_workers: The number of concurrent downloads. Default is 8.
+        """
+        # httplib2 is not thread-safe, so each worker gets its own connection.
+        local = threading.local()
+
+        def download(file_id: str, file_path: Path, mime_type: Optional[str]):
+            service = getattr(local, "service", None)
+            if service is None:
+                service = _build_service("drive", "v3", self._credentials)
+                local.service = service
+            self._download_with_service(
+                service, file_path, file_id=file_id, mime_type=mime_type
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(download, *item) for item in items]
+            for future in futures:
+                future.result()
+
     def retrieve_small_file_data(self, file_id: str) -> io.BytesIO:
         """ "
         Retrieve a small file from Google Drive as a BytesIO object.
@@ -161,7 +460,7 @@ class GoogleDriveClient:
         request = self.service.files().get_media(fileId=file_id)
         file_content = io.BytesIO()
         downloader_request_response = GoogleDriveClient._send_download_request(
-            file_content, request
+            file_content, request, chunksize=self._chunksize
         )
         self.track_download_progress(downloader_request_response)
         file_content.seek(0)
@@ -177,14 +476,62 @@ class GoogleDriveClient:
         :param sheet_range: The range of the Google Sheet to read
         :Return The data from the Google Sheet.
         """
+        return self.retrieve_sheet_data_batch(file_id, [sheet_range])[0]
+
+    def retrieve_sheet_data_batch(
+        self,
+        file_id: str,
+        sheet_ranges: List[str],
+    ) -> List[list]:
+        """Reads several ranges of a Google Sheet in a single request
+        :param file_id: The file_id  of the Google Sheet to read.
+        :param sheet_ranges: The ranges of the Google Sheet to read.
+        :Return The data from each range, in the same order as sheet_ranges.
+        """
+        if self._sheet_cache is None:
+            return self._fetch_sheet_ranges(file_id, sheet_ranges)
+
+        try:
+            revision: str = (
+                self.service.files()
+                .get(fileId=file_id, fields="modifiedTime", supportsAllDrives=True)
+                .execute()["modifiedTime"]
+            )
+        except HttpError:
+            # E.g. credentials with a Sheets-only scope cannot query Drive.
+            return self._fetch_sheet_ranges(file_id, sheet_ranges)
+        data = [
+            self._sheet_cache.get(file_id, sheet_range, revision)
+            for sheet_range in sheet_ranges
+        ]
+        missing = [i for i, values in enumerate(data) if values is None]
+        if missing:
+            fetched = self._fetch_sheet_ranges(
+                file_id, [sheet_ranges[i] for i in missing]
+            )
+            for i, values in zip(missing, fetched):
+                self._sheet_cache.set(file_id, sheet_ranges[i], revision, values)
+                data[i] = values
+            self._sheet_cache.evict()
+        return data
+
+    def _fetch_sheet_ranges(self, file_id: str, sheet_ranges: List[str]) -> List[list]:
+        """Reads several ranges of a Google Sheet from the Sheets API
+        :param file_id: The file_id  of the Google Sheet to read.
+        :param sheet_ranges: The ranges of the Google Sheet to read.
+        :Return The data from each range, in the same order as sheet_ranges.
+        """
         # Call the Sheets API
         result = (
             self._sheet_service.spreadsheets()
             .values()
-            .get(spreadsheetId=file_id, range=sheet_range)
+            .batchGet(spreadsheetId=file_id, ranges=sheet_ranges)
             .execute()
         )
-        return result.get("values", [])
+        return [
+            value_range.get("values", [])
+            for value_range in result.get("valueRanges", [])
+        ]
 
     def upload_file(
         self, file_path: str, file_name: str, mimetype: str, folder_id: str, **kwargs
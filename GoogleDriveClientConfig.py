@@ -42,6 +42,7 @@ class GoogleDriveClientConfig:
             "google_credentials.json"
         ).as_posix()
         self._scope = scope
+        self._credentials: Optional[Credentials] = None
 
     def __str__(self):
         """String representation of the GoogleDriveClientConfig"""
@@ -74,16 +75,23 @@ class GoogleDriveClientConfig:
             token.write(credentials.to_json())
 
     def get_credentials(self) -> Credentials:
-        """Gets the credentials from the token file or get new ones"""
+        """Gets the credentials from the token file or get new ones.
+        Valid credentials are kept and returned again on later calls, so
+        clients built from the same config share one credentials object."""
+        if self._credentials is not None and self._credentials.valid:
+            return self._credentials
+
         creds = self.retrieve_credentials()
 
         if creds and creds.valid:
+            self._credentials = creds
             return creds
 
         if creds and self._check_credentials_expire(creds):
             self._refresh_credentials(creds)
 
-        return self.get_credentials_from_flow()
+        self._credentials = self.get_credentials_from_flow()
+        return self._credentials
 
     def get_credentials_from_flow(self) -> Credentials:
         """Gets the credentials from the flow"""
@@ -2,12 +2,13 @@
 from typing import Any
 
 import numpy as np
-import plotly.express as px
 import polars as pl
 import polars.selectors as cs
 
-from sklearn.decomposition import PCA
+from sklearn.decomposition import PCA, IncrementalPCA
 from sklearn import set_config
+from sklearn.exceptions import NotFittedError
+from sklearn.utils import gen_batches
 
 set_config(transform_output="polars")
 
@@ -20,6 +21,7 @@ class PcaTransformer:
     - The class requires the number of components to use in the pca model.
     - The class has the following methods:
         - fit: Fit the PCA model to the dataset.
+        - fit_incremental: Fit the PCA model to the dataset in batches.
         - transform: Transform the dataset using the fitted PCA model.
         - filter_components: Filter the components of the PCA model based on a threshold.
         - plot_pca_variance: Plot the variance explained by each principal component.
@@ -28,14 +30,42 @@ class PcaTransformer:
 
     """
 
-    def __init__(self, n_components: int = 3) -> None:
+    def __init__(
+        self,
+        n_components: int = 3,
+        svd_solver: str = "auto",
+        random_state: int | None = None,
+    ) -> None:
         """
         Initialize the PcaTransformer class.
         :param n_components: The number of components to use in the PCA model.
+        :param svd_solver: The SVD solver of the PCA model. "randomized" costs
+         O(n·d·k) instead of O(n·d²) when the data is much wider than
+         n_components; "auto" lets sklearn choose from the data shape.
+        :param random_state: Seed for the "randomized" and "arpack" solvers.
         """
         self.columns = None
+        self._transform_rename: dict[str, str] = {}
+        self._components_df: pl.DataFrame | None = None
         self._n_components = n_components
-        self._pca: PCA = PCA(n_components=self._n_components)
+        self._pc_labels: list[str] = [f"PC_{i + 1}" for i in range(n_components)]
+        self._components_rename: dict[str, str] = {
+            f"column_{i}": label for i, label in enumerate(self._pc_labels)
+        }
+        self._svd_solver = svd_solver
+        self._random_state = random_state
+        self._pca: PCA | IncrementalPCA = self._build_pca()
+
+    def _build_pca(self) -> PCA:
+        """
+        Build an unfitted PCA model from the solver settings.
+        :return: PCA: The PCA model.
+        """
+        return PCA(
+            n_components=self._n_components,
+            svd_solver=self._svd_solver,
+            random_state=self._random_state,
+        )
 
     def __repr__(self) -> str:
         return f"Pca(n_components={self._n_components})"
@@ -45,18 +75,15 @@ class PcaTransformer:
         return self._n_components
 
     @property
-    def make_pca_components_dataframe(self):
+    def make_pca_components_dataframe(self) -> pl.DataFrame:
         """
-        Create a DataFrame with the components of the PCA model.
+        Get the DataFrame with the components of the PCA model,
+        built once when the model is fitted.
         :return: pl.DataFrame: A DataFrame with the components of the PCA model.
         """
-        return (
-            pl.DataFrame(self._pca.components_, orient="col")
-            .rename(
-                mapping={f"column_{i}": f"PC_{i + 1}" for i in range(self.n_components)}
-            )
-            .with_columns(pl.Series(pl.Series(self.columns)).alias("feature"))
-        )
+        if self._components_df is None:
+            raise NotFittedError("The PCA model must be fitted first.")
+        return self._components_df
 
     @property
     def explained_variance_ratio(self) -> np.ndarray:
@@ -72,19 +99,57 @@ class PcaTransformer:
         :param x_train: The dataset to fit the PCA model to.
         :return: PcaTransformer: The PcaTransformer object.
         """
+        # Rebuild so a previous fit_incremental does not replace the solver.
+        self._pca = self._build_pca()
         self._pca.fit(x_train)
-        self.columns = x_train.columns
+        self._store_fit_attributes(x_train)
         return self
 
+    def fit_incremental(
+        self, x_train: pl.DataFrame, batch_size: int = 10_000
+    ) -> "PcaTransformer":
+        """
+        Fit the PCA model to the dataset in batches, keeping memory
+        bounded by the batch size instead of the dataset size.
+        :param x_train: The dataset to fit the PCA model to.
+        :param batch_size: The number of rows to fit per batch.
+        :return: PcaTransformer: The PcaTransformer object.
+        """
+        self._pca = IncrementalPCA(
+            n_components=self._n_components, batch_size=batch_size
+        )
+        for batch in gen_batches(
+            x_train.height, batch_size, min_batch_size=self._n_components
+        ):
+            self._pca.partial_fit(x_train[batch])
+        self._store_fit_attributes(x_train)
+        return self
+
+    def _store_fit_attributes(self, x_train: pl.DataFrame) -> None:
+        """
+        Store the attributes derived from the fitted PCA model.
+        :param x_train: The dataset the PCA model was fitted to.
+        """
+        self.columns = x_train.columns
+        # Pin the output per estimator so transform gets polars back directly.
+        self._pca.set_output(transform="polars")
+        self._transform_rename = {
+            name: f"PC{i + 1}"
+            for i, name in enumerate(self._pca.get_feature_names_out())
+        }
+        self._components_df = (
+            pl.DataFrame(self._pca.components_, orient="col")
+            .rename(mapping=self._components_rename)
+            .with_columns(pl.Series(pl.Series(self.columns)).alias("feature"))
+        )
+
     def transform(self, x_test: pl.DataFrame) -> pl.DataFrame:
         """
         Transform the dataset using the fitted PCA model.
         :param x_test: The dataset to transform.
         :return: pl.DataFrame: The transformed dataset.
         """
-        return pl.DataFrame(self._pca.transform(x_test)).rename(
-            mapping={f"pca{i}": f"PC{i + 1}" for i in range(self._n_components)}
-        )
+        return self._pca.transform(x_test).rename(mapping=self._transform_rename)
 
     def filter_components(
         self, limit_components: int = 2, threshold: float = 0.1
@@ -109,7 +174,7 @@ class PcaTransformer:
         """
         return pl.DataFrame(
             {
-                "PC": [f"PC_{i + 1}" for i in range(self.n_components)],
+                "PC": self._pc_labels,
                 "var": self.explained_variance_ratio,
             }
         ).plot(x="PC", **kwargs)
@@ -138,7 +203,7 @@ class PcaTransformer:
                 }
             )
             .with_columns(
-                PC=pl.Series([f"PC_{i + 1}" for i in range(limit_components)])
+                PC=pl.Series(self._pc_labels[:limit_components])
             )
             .plot.bar(x="PC", **kwargs)
         )
@@ -180,6 +245,9 @@ class PcaTransformer:
         :param kwargs: Additional keyword arguments to pass to the plot method.
         :return: px: The plot of the dataset in 3D.
         """
+        # plotly is heavy to import and only needed for plotting.
+        import plotly.express as px
+
         data = self.transform(dataset)
         if color_col is not None:
             data = data.with_columns(color_col)
@@ -205,27 +273,19 @@ class PcaTransformer:
             fig.update_traces(marker_size=3)
 
         if biplot:
-            scale = biplot_scale
+            # One (PC1, PC2, PC3) loading vector per original feature.
+            loadings = self._pca.components_[:3].T * biplot_scale
             annots = []
-            for column in data.columns:
-                loadings = {
-                    f"PC{i}": val * scale
-                    for i, val in enumerate(data.get_column(column), 1)
-                }
-                new_fig = px.line_3d(
-                    x=[0, loadings["PC1"]],
-                    y=[0, loadings["PC2"]],
-                    z=[0, loadings["PC3"]],
-                    width=20,
-                )
-                for trace in new_fig["data"]:
-                    fig.add_trace(trace=trace, row=1, col=1)
+            for feature, (x_load, y_load, z_load) in zip(self.columns, loadings):
+                new_fig = px.line_3d(x=[0, x_load], y=[0, y_load], z=[0, z_load])
+                for trace in new_fig.data:
+                    fig.add_trace(trace)
                 annot = {
                     "showarrow": False,
-                    "x": loadings["PC1"],
-                    "y": loadings["PC2"],
-                    "z": loadings["PC3"],
-                    "text": column,
+                    "x": x_load,
+                    "y": y_load,
+                    "z": z_load,
+                    "text": feature,
                     "xanchor": "left",
                     "xshift": 1,
                     "opacity": 0.7,
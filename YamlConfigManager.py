@@ -1,9 +1,115 @@
 # *-* encoding: utf-8 *-*
+import copy
+import json
+import os
+import stat
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# Parsed configs keyed by (resolved path, mtime in ns, size in bytes).
+_YAML_CACHE: OrderedDict[tuple[str, int, int], dict[str, Any]] = OrderedDict()
+_YAML_CACHE_MAX_SIZE: int = 100
+
+# Set DSU_CONFIG_JSON_CACHE=1 to keep a "<config>.json" sidecar next to each file.
+_JSON_CACHE_ENV_VAR: str = "DSU_CONFIG_JSON_CACHE"
+
+# Read buffer used when parsing YAML files.
+_READ_BUFFER_SIZE: int = 1 << 20
+
+# Marks a missing key in dict lookups.
+_MISSING = object()
+
+
+def _parse_yaml(file_path: Path) -> dict[str, Any]:
+    """Parses a YAML file.
+    :param file_path: The path to the YAML file.
+    :return: The parsed content."""
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        with os.fdopen(fd, "rb", buffering=_READ_BUFFER_SIZE) as stream:
+            # The parser reads strictly front to back; let the kernel read ahead.
+            # The advice is optional; non-seekable inputs such as FIFOs reject it.
+            if hasattr(os, "posix_fadvise"):
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                except OSError:
+                    pass
+            return yaml.load(stream, Loader=_Loader)
+    except yaml.YAMLError as exc:
+        raise ValueError(f"Error while loading config file: {exc}")
+
+
+def _parse_yaml_with_json_sidecar(
+    file_path: Path, yaml_mtime_ns: int, yaml_size: int
+) -> dict[str, Any]:
+    """Parses a YAML file through its JSON sidecar when the sidecar was built
+    from the same file version, otherwise parses the YAML and refreshes the
+    sidecar.
+    The sidecar records the YAML's mtime and size and is only used on an exact
+    match, so copies that keep an older mtime (rsync -t, cp -p) are detected.
+    It is only written when the content survives a JSON round trip
+    (e.g., no dates or non-string keys), and is skipped if the directory is
+    read-only.
+    :param file_path: The path to the YAML file.
+    :param yaml_mtime_ns: Modification time of the YAML file in nanoseconds.
+    :param yaml_size: Size of the YAML file in bytes.
+    :return: The parsed content."""
+    json_path = file_path.with_name(f"{file_path.name}.json")
+    source = {"mtime_ns": yaml_mtime_ns, "size": yaml_size}
+    try:
+        sidecar = json.loads(json_path.read_bytes())
+        if sidecar["source"] == source:
+            return sidecar["config"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    config = _parse_yaml(file_path)
+    try:
+        if json.loads(json.dumps(config)) == config:
+            dumped = json.dumps({"source": source, "config": config})
+            tmp_path = json_path.with_name(f"{json_path.name}.{os.getpid()}.tmp")
+            # Configs may hold credentials; never expose them more than the YAML.
+            mode = stat.S_IMODE(file_path.stat().st_mode)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+            with os.fdopen(fd, "w") as tmp_file:
+                tmp_file.write(dumped)
+            os.replace(tmp_path, json_path)
+    except (OSError, TypeError, ValueError):
+        pass
+    return config
+
+
+def _load_yaml_cached(file_path: Path) -> dict[str, Any]:
+    """Loads a YAML file, reusing the parsed content while the file is unchanged.
+    :param file_path: The path to the YAML file.
+    :return: The parsed content. Callers must not mutate it."""
+    file_stat = file_path.stat()
+    key = (str(file_path.resolve()), file_stat.st_mtime_ns, file_stat.st_size)
+    config = _YAML_CACHE.get(key)
+    if config is not None:
+        _YAML_CACHE.move_to_end(key)
+        return config
+
+    if os.environ.get(_JSON_CACHE_ENV_VAR) == "1":
+        config = _parse_yaml_with_json_sidecar(
+            file_path, file_stat.st_mtime_ns, file_stat.st_size
+        )
+    else:
+        config = _parse_yaml(file_path)
+
+    _YAML_CACHE[key] = config
+    if len(_YAML_CACHE) > _YAML_CACHE_MAX_SIZE:
+        _YAML_CACHE.popitem(last=False)
+    return config
+
 
 class YamlConfigManager:
     """
@@ -14,6 +120,7 @@ class YamlConfigManager:
     Attributes:
         _config_file: The absolute path to the config file.
         _config: The loaded configuration from the config file.
+        _prop_cache: Properties already resolved by get_property.
 
     Methods:
         __init__: Initializes the Config object.
@@ -25,22 +132,31 @@ class YamlConfigManager:
         assert isinstance(file_path, Path), "file_path must be a Path object."
         self._config_file: Path = file_path
         self._config = self._load_config()
+        self._prop_cache: dict[tuple, Any] = {}
 
     def _load_config(self) -> dict[str, Any]:
-        """Loads the configuration from the config file."""
-        try:
-            with open(self._config_file, "r") as stream:
-                return yaml.safe_load(stream)
-        except yaml.YAMLError as exc:
-            raise ValueError(f"Error while loading config file: {exc}")
+        """Loads the configuration from the config file.
+        The parsed file is cached, so each instance gets its own copy."""
+        return copy.deepcopy(_load_yaml_cached(self._config_file))
 
     def get_property(self, *keys) -> Any:
         """Gets a property from the loaded configuration.
         :param keys: The keys to access the property."""
+        value = self._prop_cache.get(keys, _MISSING)
+        if value is not _MISSING:
+            return value
+
         value = self._config
         for key in keys:
-            try:
-                value = value[key]
-            except KeyError:
+            if isinstance(value, dict):
+                value = value.get(key, _MISSING)
+            else:
+                # Sequences (e.g., lists of servers) are indexed by position.
+                try:
+                    value = value[key]
+                except (IndexError, KeyError, TypeError):
+                    value = _MISSING
+            if value is _MISSING:
                 raise ValueError(f"Key {key} not found in config file.")
+        self._prop_cache[keys] = value
         return value
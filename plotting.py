@@ -5,23 +5,36 @@ plotting utils
 This module contains plotting utility functions.
 """
 
+from bisect import bisect_right
+from functools import lru_cache
+
 import matplotlib.pyplot as plt
+import numpy as np
 from typing import Any, Callable
 
+# Ascending scale factors used by scale_number_values.
+_SCALES: tuple[float, ...] = (1.0, 1e3, 1e6, 1e9, 1e12)
+_SCALES_ARRAY: np.ndarray = np.array(_SCALES)
+
 
 def label_bar_chart(
     axes: plt.Axes,
-    fmt: str | Callable,
+    fmt: str | Callable | None = None,
     **kwargs,
 ) -> None:
     """annotate a bar chart
     :param axes: axes object:
-    :param fmt: format string or callable.
+    :param fmt: format string or callable. Defaults to None, which labels
+    every bar of a container at once with scale_number_values_array.
     see: https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.bar_label.html
     :param kwargs: keyword arguments passed to axes.Annotate
     see: https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.annotate.html"""
     for container_object in axes.containers:
-        axes.bar_label(container=container_object, fmt=fmt, **kwargs)
+        if fmt is None:
+            labels = scale_number_values_array(container_object.datavalues)
+            axes.bar_label(container=container_object, labels=labels, **kwargs)
+        else:
+            axes.bar_label(container=container_object, fmt=fmt, **kwargs)
 
 
 def label_chart_line(
@@ -63,7 +76,31 @@ def scale_number_values(value: str | int | float) -> str | int | float:
     except ValueError:
         return value
 
-    scale_factors: list = [1e12, 1e9, 1e6, 1e3, 1]
-    for scale in scale_factors:
-        if numeric_value >= scale:
-            return f"{numeric_value / scale:,.2f}"
+    return _scale_number(numeric_value)
+
+
+@lru_cache(maxsize=4096)
+def _scale_number(numeric_value: float) -> str:
+    """Format number scale of a numeric value, caching repeated values.
+    :param numeric_value: value to format.
+    :return: formatted value.
+    """
+    # The scale follows the magnitude, so -5e6 and 5e6 share it; magnitudes
+    # below 1, including zero, are left unscaled.
+    scale_index: int = max(bisect_right(_SCALES, abs(numeric_value)) - 1, 0)
+    return f"{numeric_value / _SCALES[scale_index]:,.2f}"
+
+
+def scale_number_values_array(values: np.ndarray) -> np.ndarray:
+    """Format number scale for a whole array at once.
+    Same output as scale_number_values, without a Python-level scale
+    lookup per value.
+    :param values: numeric values to format.
+    :return: array of formatted values.
+    """
+    numeric_values: np.ndarray = np.asarray(values, dtype=float).ravel()
+    scale_index = np.maximum(
+        np.searchsorted(_SCALES_ARRAY, np.abs(numeric_values), side="right") - 1, 0
+    )
+    scaled_values = numeric_values / _SCALES_ARRAY[scale_index]
+    return np.array([f"{value:,.2f}" for value in scaled_values.tolist()])